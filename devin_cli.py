@@ -15,14 +15,28 @@ Env:
   DEVIN_USE_GH_APP=true|false            # let Devin's GH App open PRs (default true)
 """
 
-import os, time, random, re, datetime as dt
-from typing import Optional, Dict, Any, List, Tuple
+import os, time, random, re, json, uuid, atexit, asyncio, tempfile, threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 import requests
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
-from tabulate import tabulate
+from rich.table import Table
+
+try:  # optional: `pip install devin-cli[fast]`
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: `pip install devin-cli[http2]`
+    import httpx
+except ImportError:
+    httpx = None
 
 # ---------- CLI ----------
 app = typer.Typer(no_args_is_help=True)
@@ -48,83 +62,257 @@ POLL_MSG_INTERVAL_S = 3
 EXTRA_SCOPE_WAIT_S  = 45    # extra wait to catch Devin's final scoping block
 POLL_PR_TIMEOUT_S   = 4000   # wait up to 4 min for PR URL
 POLL_PR_INTERVAL_S  = 6
+POLL_MAX_INTERVAL_S = 30    # idle polls back off (x1.5 per quiet tick) up to this
+PROMPT_WARM_INTERVAL_S = 10 # keep the Devin connection warm while waiting on the PR prompt
+RETRY_BACKOFF_CAP_S = 20.0  # max sleep between HTTP retries (urllib3 adapter and our own loop)
+GH_LIST_CACHE_TTL_S = 30    # serve issue lists from cache this long before revalidating
+GH_CACHE_MAX_ENTRIES = 64    # pages of up to 100 issues each; loaded in full on every command
+GH_CACHE_PATH = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                             "devin-cli", "gh.json")
+
+# ---------- HTTP sessions ----------
+def _make_session(headers: Dict[str, str]) -> requests.Session:
+    """
+    Pooled keep-alive session; urllib3 handles transport/5xx retries with capped, jittered backoff.
+    Retry-After is left to _request_with_retries so a huge server value can't stall the CLI.
+    """
+    s = requests.Session()
+    s.headers.update(headers)
+    retry = Retry(total=4, backoff_factor=0.8, backoff_max=RETRY_BACKOFF_CAP_S, backoff_jitter=1.0,
+                  status_forcelist=[500, 502, 503, 504], allowed_methods=["GET", "POST"],
+                  respect_retry_after_header=False, raise_on_status=False)
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return s
+
+def _make_devin_client():
+    """HTTP/2 httpx client for api.devin.ai when httpx[http2] is installed, else a pooled requests session."""
+    if httpx is None:
+        return _make_session(DV_H)
+    try:
+        # http2/limits must go on the transport: Client ignores them when transport= is given.
+        transport = httpx.HTTPTransport(http2=True, retries=4,
+                                        limits=httpx.Limits(max_keepalive_connections=8))
+        # follow_redirects matches requests' default, so both backends treat 3xx the same.
+        return httpx.Client(headers=DV_H, timeout=30, transport=transport, follow_redirects=True)
+    except ImportError:  # httpx present but without the h2 extra
+        return _make_session(DV_H)
+
+_GH_SESSION = _make_session(GH_H)  # GitHub's REST API stays on requests
+_DV_SESSION = _make_devin_client()
+
+# Errors worth retrying/ignoring from either backend.
+_HTTP_ERRORS: Tuple[type, ...] = (requests.RequestException,) + ((httpx.HTTPError,) if httpx else ())
 
 # ---------- HTTP with retries ----------
-def _request_with_retries(method, url, headers=None, json=None, timeout=30, max_retries=4):
+# requests.Response or httpx.Response: both expose .content, .headers and .status_code.
+_Response = Any
+
+def _json(r: _Response) -> Any:
+    """
+    Parse a JSON body straight from bytes (orjson when installed), skipping requests' text decoding.
+    Bad bodies raise requests.JSONDecodeError, as Response.json() did, so _HTTP_ERRORS still covers them.
+    """
+    try:
+        return orjson.loads(r.content) if orjson else json.loads(r.content)
+    except ValueError as e:
+        raise requests.JSONDecodeError(getattr(e, "msg", str(e)), getattr(e, "doc", ""),
+                                       getattr(e, "pos", 0)) from e
+
+def _backoff_s(attempt: int, r: Optional[_Response] = None) -> float:
+    """Capped exponential backoff with jitter; a numeric Retry-After from the server wins."""
+    retry_after = r.headers.get("Retry-After") if r is not None else None
+    if retry_after:
+        try:
+            return max(0.0, min(RETRY_BACKOFF_CAP_S, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to our own backoff
+    return min(RETRY_BACKOFF_CAP_S, 0.5 * (2 ** attempt)) * (0.5 + random.random() / 2)
+
+# requests sessions already back off on 5xx/connection errors via the adapter's Retry, so the
+# loop is only an outer safety net there; httpx clients get the full retry budget here.
+def _request_with_retries(method, url, headers=None, json=None, timeout=30, max_retries=None,
+                          session=_GH_SESSION, etag: Optional[str] = None):
+    if max_retries is None:
+        max_retries = 1 if isinstance(session, requests.Session) else 4
+    if etag:
+        headers = {**(headers or {}), "If-None-Match": etag}
     attempt = 0
     while True:
         try:
-            r = requests.request(method, url, headers=headers, json=json, timeout=timeout)
-        except requests.RequestException:
+            r = session.request(method, url, headers=headers, json=json, timeout=timeout)
+        except _HTTP_ERRORS:
             if attempt >= max_retries: raise
-            time.sleep(1.0 + attempt * 0.8); attempt += 1; continue
+            time.sleep(_backoff_s(attempt)); attempt += 1; continue
         if 500 <= r.status_code < 600 and attempt < max_retries:
-            time.sleep(1.0 + attempt * 0.8); attempt += 1; continue
+            time.sleep(_backoff_s(attempt, r)); attempt += 1; continue
         return r
 
 # ---------- GitHub ----------
-def gh_list_issues(repo: str, state="open"):
+# On-disk ETag cache: {url: {"etag", "json", "ts"}}. GitHub doesn't charge rate limit for 304s.
+# Loaded on first use, updated in memory, and flushed once at exit if anything changed.
+_GH_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+_GH_CACHE_DIRTY = False
+_GH_CACHE_LOCK = threading.RLock()  # bulk fetches hit the cache from worker threads
+
+def _valid_cache_entry(entry: Any) -> bool:
+    return isinstance(entry, dict) and {"etag", "json", "ts"} <= entry.keys() \
+        and isinstance(entry["ts"], (int, float))
+
+def _gh_cache() -> Dict[str, Dict[str, Any]]:
+    global _GH_CACHE
+    with _GH_CACHE_LOCK:
+        if _GH_CACHE is None:
+            try:
+                with open(GH_CACHE_PATH, encoding="utf-8") as f:
+                    raw = json.load(f)
+            except (OSError, ValueError):
+                raw = {}
+            if not isinstance(raw, dict):
+                raw = {}
+            _GH_CACHE = {url: e for url, e in raw.items() if _valid_cache_entry(e)}
+            atexit.register(_flush_gh_cache)
+        return _GH_CACHE
+
+def _put_gh_cache(url: str, entry: Dict[str, Any]) -> None:
+    global _GH_CACHE_DIRTY
+    with _GH_CACHE_LOCK:
+        _gh_cache()[url] = entry
+        _GH_CACHE_DIRTY = True
+
+def _flush_gh_cache() -> None:
+    """Atomically write the cache (mode 0600; it may hold private-repo issues) if it changed."""
+    global _GH_CACHE_DIRTY
+    with _GH_CACHE_LOCK:
+        if not _GH_CACHE_DIRTY or _GH_CACHE is None:
+            return
+        cache = _GH_CACHE
+        if len(cache) > GH_CACHE_MAX_ENTRIES:
+            for url in sorted(cache, key=lambda u: cache[u]["ts"])[:len(cache) - GH_CACHE_MAX_ENTRIES]:
+                del cache[url]
+        cache_dir = os.path.dirname(GH_CACHE_PATH)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=".gh-", suffix=".json")  # created 0600
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache, f)
+                os.replace(tmp, GH_CACHE_PATH)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            _GH_CACHE_DIRTY = False
+        except OSError:
+            pass  # cache is best-effort
+
+def _gh_get_json(url: str, ttl_s: float = 0) -> Tuple[int, Any, Optional[str]]:
+    """
+    GET a GitHub resource, revalidating any cached copy with If-None-Match.
+    Returns (status, json, next_page_url); json is None for 401/404.
+    """
+    cache = _gh_cache()
+    hit = cache.get(url)
+    if hit and time.time() - hit["ts"] < ttl_s:
+        return 200, hit["json"], hit.get("next")
+    r = _request_with_retries("GET", url, timeout=30, session=_GH_SESSION,
+                              etag=hit["etag"] if hit else None)
+    if r.status_code == 304 and hit:
+        _put_gh_cache(url, {**hit, "ts": time.time()})
+        return 200, hit["json"], hit.get("next")
+    if r.status_code in (401, 404):
+        return r.status_code, None, None
+    r.raise_for_status()
+    data = _json(r)
+    next_url = r.links.get("next", {}).get("url")
+    if r.headers.get("ETag"):
+        _put_gh_cache(url, {"etag": r.headers["ETag"], "json": data, "next": next_url, "ts": time.time()})
+    return r.status_code, data, next_url
+
+def gh_iter_issues(repo: str, state="open") -> Iterator[Dict[str, Any]]:
+    """Yield issues (not PRs) page by page, following the Link: rel="next" header."""
     if not repo:
         raise SystemExit("No repo provided. Pass --repo owner/repo or set DEFAULT_REPO.")
-    url = f"https://api.github.com/repos/{repo}/issues?state={state}"
-    r = _request_with_retries("GET", url, headers=GH_H, timeout=30)
-    if r.status_code == 401:
-        raise SystemExit("GitHub 401 — invalid/missing GITHUB_TOKEN for private repos (public repos don’t need it).")
-    r.raise_for_status()
-    return [i for i in r.json() if "pull_request" not in i]
+    url: Optional[str] = f"https://api.github.com/repos/{repo}/issues?state={state}&per_page=100"
+    while url:
+        status, data, url = _gh_get_json(url, ttl_s=GH_LIST_CACHE_TTL_S)
+        if status == 401:
+            raise SystemExit("GitHub 401 — invalid/missing GITHUB_TOKEN for private repos (public repos don’t need it).")
+        if status == 404:
+            raise SystemExit(f"Repo {repo} not found.")
+        yield from (i for i in data if "pull_request" not in i)
 
 def gh_get_issue(repo: str, number: int):
     url = f"https://api.github.com/repos/{repo}/issues/{number}"
-    r = _request_with_retries("GET", url, headers=GH_H, timeout=30)
-    if r.status_code == 404:
+    status, data, _ = _gh_get_json(url)
+    if status == 404:
         raise SystemExit(f"Issue #{number} not found in {repo}.")
-    r.raise_for_status()
-    return r.json()
+    if status == 401:
+        raise SystemExit("GitHub 401 — invalid/missing GITHUB_TOKEN for private repos (public repos don’t need it).")
+    return data
+
+def gh_get_issues_bulk(repo: str, numbers: List[int]) -> List[Dict[str, Any]]:
+    """Fetch several issues concurrently over the pooled GitHub session (order preserved)."""
+    if not numbers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(16, len(numbers))) as pool:
+        return list(pool.map(lambda n: gh_get_issue(repo, n), numbers))
 
 # ---------- Devin API ----------
+_NONCE_FMT = "\n\n[session_nonce:{}]"  # unique suffix so idempotent=False always yields a new session
+
 def devin_create_session(prompt: str, title: str) -> Dict[str, Any]:
     if not DEVIN_API_KEY:
         raise SystemExit("DEVIN_API_KEY is not set. Get it from Devin → Settings → Devin’s API.")
-    nonce = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+    nonce = uuid.uuid4().hex[:12]
     body = {
-        "prompt": f"{prompt}\n\n[session_nonce:{nonce}]",
+        "prompt": prompt + _NONCE_FMT.format(nonce),
         "idempotent": False,  # force new session
         "title": f"{title} • {nonce}",
     }
-    r = _request_with_retries("POST", f"{DEVIN_API_BASE}/sessions", headers=DV_H, json=body, timeout=60)
+    r = _request_with_retries("POST", f"{DEVIN_API_BASE}/sessions", json=body, timeout=60,
+                              session=_DV_SESSION)
     if r.status_code == 401:
         raise SystemExit("Devin API 401: Invalid/expired key. Regenerate in Devin → Settings → Devin’s API.")
     r.raise_for_status()
-    ses = r.json()
+    ses = _json(r)
     console.print(f"[dim]New Devin session:[/] {ses.get('session_id')} • {body['title']}")
     return ses
 
 def devin_send_message(session_id: str, message: str):
     _request_with_retries("POST",
         f"{DEVIN_API_BASE}/sessions/{session_id}/message",
-        headers={**DV_H, "Content-Type": "application/json"},
-        json={"message": message}, timeout=30)
+        json={"message": message}, timeout=30, session=_DV_SESSION)
 
 def devin_get_session(session_id: str) -> Dict[str, Any]:
-    r = _request_with_retries("GET", f"{DEVIN_API_BASE}/sessions/{session_id}", headers=DV_H, timeout=30)
+    r = _request_with_retries("GET", f"{DEVIN_API_BASE}/sessions/{session_id}", timeout=30,
+                              session=_DV_SESSION)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 # ---------- Confidence extraction ----------
+# Applied with .match() to a single line located by rfind, so no ^/$ anchors or MULTILINE needed.
 CONF_LINE_RE = re.compile(
-    r"""(?imx)
-    ^\s*Confidence[^:\n]*:\s*
-    (?P<label>High|Medium|Low|Green|Yellow|Red)?\s*
-    (?P<emoji>[🟢🟡🔴])?
-    (?:\s*[-–—:]\s*(?P<why>.+))?
-    $
-    """
+    r"[ \t]*Confidence[^:\n]*:\s*"
+    r"(?:(?P<label>High|Medium|Low|Green|Yellow|Red)\b)?\s*"
+    r"(?P<emoji>[🟢🟡🔴])?"
+    r"(?:\s*[-–—:]\s*(?P<why>.+))?",
+    re.I,
 )
 
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
 def extract_confidence_from_texts(texts: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    _match = CONF_LINE_RE.match
     for t in reversed(texts[-20:]):
-        for line in reversed(t.splitlines()[-12:]):
-            mo = CONF_LINE_RE.search(line)
+        tl = t.lower()
+        if len(tl) != len(t):  # rare non-ASCII case changes would skew offsets
+            tl = t.translate(_ASCII_LOWER)
+        # Walk "confidence" occurrences from the end; regex only the line holding each.
+        idx = tl.rfind("confidence")
+        while idx >= 0:
+            start = t.rfind("\n", 0, idx) + 1
+            end = t.find("\n", idx)
+            mo = _match(t, start, end if end >= 0 else len(t))
+            idx = tl.rfind("confidence", 0, start)
             if not mo: continue
             emoji = (mo.group("emoji") or "").strip()
             label = (mo.group("label") or "").strip().lower()
@@ -150,65 +338,78 @@ def newest_devin_after(messages: List[Dict[str, Any]], baseline_len: int) -> Lis
     new_msgs = messages[baseline_len:]
     return [m.get("message","") for m in new_msgs if is_devin_message(m) and m.get("message")]
 
+_SCOPE_RE = re.compile(r"\b(current|requested|files|tests|risks)", re.I)
+_CONF_SUBSTR = re.compile(r"confidence\s*:", re.I)
+
 def looks_like_scoping(text: str) -> bool:
-    tl = text.lower()
-    if "confidence:" in tl:
+    if _CONF_SUBSTR.search(text):
         return True
-    keys = ["current", "requested", "files", "tests", "risks"]
-    return sum(1 for k in keys if k in tl) >= 2
+    seen = set()
+    for mo in _SCOPE_RE.finditer(text):
+        seen.add(mo.group(1).lower())
+        if len(seen) >= 2:
+            return True
+    return False
 
 # ---------- Pollers ----------
-def poll_for_final_scoping(session_id: str, baseline_len: int,
-                           timeout_s=POLL_MSG_TIMEOUT_S,
-                           extra_wait_s=EXTRA_SCOPE_WAIT_S) -> Tuple[List[str], Dict[str, Any]]:
+def _next_interval(interval: float, base: float, progressed: bool) -> float:
+    """Reset to base on new Devin messages, otherwise back off towards POLL_MAX_INTERVAL_S."""
+    return base if progressed else min(POLL_MAX_INTERVAL_S, interval * 1.5)
+
+# Pollers are coroutines so several Devin sessions can be polled concurrently;
+# the blocking GET runs in a worker thread on the shared pooled session.
+async def _adevin_get(session_id: str) -> Dict[str, Any]:
+    return await asyncio.to_thread(devin_get_session, session_id)
+
+async def apoll_for_final_scoping(session_id: str, baseline_len: int,
+                                  timeout_s=POLL_MSG_TIMEOUT_S,
+                                  extra_wait_s=EXTRA_SCOPE_WAIT_S) -> Tuple[List[str], Dict[str, Any]]:
     """
     Poll until a Devin-authored message that *looks like scoping* appears after baseline.
     If first we see a “thinking” message, keep polling up to extra_wait_s.
     """
-    deadline = time.time() + timeout_s
-    best_text: Optional[str] = None
-    snap: Dict[str, Any] = devin_get_session(session_id)
-
-    while time.time() < deadline:
-        time.sleep(POLL_MSG_INTERVAL_S)
-        snap = devin_get_session(session_id)
-        msgs = snap.get("messages") or []
-        new_devins = newest_devin_after(msgs, baseline_len)
-        for txt in reversed(new_devins):
-            if looks_like_scoping(txt):
-                return [txt], snap
-            if best_text is None:
-                best_text = txt
-
-    end2 = time.time() + extra_wait_s
-    while time.time() < end2:
-        time.sleep(POLL_MSG_INTERVAL_S)
-        snap = devin_get_session(session_id)
-        msgs = snap.get("messages") or []
-        new_devins = newest_devin_after(msgs, baseline_len)
-        for txt in reversed(new_devins):
-            if looks_like_scoping(txt):
-                return [txt], snap
-            if best_text is None:
-                best_text = txt
-
+    snap: Dict[str, Any] = await _adevin_get(session_id)
+    cursor = baseline_len  # only messages past the cursor are scanned each tick
+    classified: List[Tuple[bool, str]] = []  # (is_user, text) for msgs[baseline_len:cursor]
+    interval = POLL_MSG_INTERVAL_S
+
+    for phase_s in (timeout_s, extra_wait_s):
+        deadline = time.time() + phase_s
+        while time.time() < deadline:
+            await asyncio.sleep(min(interval, max(0.0, deadline - time.time())))
+            snap = await _adevin_get(session_id)
+            msgs = snap.get("messages") or []
+            fresh = [(is_user_message(m), m.get("message") or "") for m in msgs[cursor:]]
+            classified.extend(fresh)
+            cursor += len(fresh)
+            interval = _next_interval(interval, POLL_MSG_INTERVAL_S, any(not u for u, _ in fresh))
+            for is_user, txt in reversed(fresh):
+                if not is_user and txt and looks_like_scoping(txt):
+                    return [txt], snap
+
+    # No scoping block: fall back to the newest Devin message seen.
+    best_text = next((txt for is_user, txt in reversed(classified) if not is_user and txt), None)
     return ([best_text] if best_text else []), snap
 
 PR_URL_RE = re.compile(r"https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+/pull/\d+")
 
-def poll_for_pr_url(session_id: str, timeout_s=POLL_PR_TIMEOUT_S) -> Optional[str]:
+async def apoll_for_pr_url(session_id: str, baseline_len: int = 0,
+                          timeout_s=POLL_PR_TIMEOUT_S) -> Optional[str]:
     """
     Poll Devin session until PR URL appears (structured_output.artifacts.pr_url OR inside Devin messages).
+    Messages before baseline_len (already seen while scoping) are not scanned.
     Shows a small spinner while polling.
     """
     deadline = time.time() + timeout_s
     spinner = ["⠋","⠙","⠹","⠸","⠼","⠴","⠦","⠧","⠇","⠏"]
     i = 0
-    seen_len = 0
+    seen_len = baseline_len
+    interval = POLL_PR_INTERVAL_S
+    _search = PR_URL_RE.search
 
     while time.time() < deadline:
-        time.sleep(POLL_PR_INTERVAL_S)
-        cur = devin_get_session(session_id)
+        await asyncio.sleep(min(interval, max(0.0, deadline - time.time())))
+        cur = await _adevin_get(session_id)
         # 1) structured_output
         so = cur.get("structured_output") or {}
         art = so.get("artifacts") or {}
@@ -220,9 +421,11 @@ def poll_for_pr_url(session_id: str, timeout_s=POLL_PR_TIMEOUT_S) -> Optional[st
         # 2) messages text
         msgs = cur.get("messages") or []
         new_msgs = msgs[seen_len:]
+        interval = _next_interval(interval, POLL_PR_INTERVAL_S, any(map(is_devin_message, new_msgs)))
         for m in new_msgs:
             txt = m.get("message","") or ""
-            mo = PR_URL_RE.search(txt)
+            if "/pull/" not in txt: continue
+            mo = _search(txt)
             if mo:
                 console.print("\r", end="")
                 return mo.group(0)
@@ -235,32 +438,17 @@ def poll_for_pr_url(session_id: str, timeout_s=POLL_PR_TIMEOUT_S) -> Optional[st
     console.print("\r", end="")
     return None
 
-# ---------- CLI Commands ----------
-@issues_app.command("list")
-def list_issues(repo: str = typer.Option(DEFAULT_REPO or ..., help="owner/repo")):
-    issues = gh_list_issues(repo)
-    rows = [[i["number"], i["title"], i["state"],
-             ",".join([l["name"] for l in i.get("labels", [])]),
-             i["html_url"]] for i in issues]
-    console.print(Panel.fit(f"[bold]{repo}[/] • {len(rows)} issues"))
-    print(tabulate(rows, headers=["#", "title", "state", "labels", "url"], tablefmt="github"))
-
-@issues_app.command("scope")
-def scope_issue(number: int = typer.Option(..., "-n", help="issue number"),
-                repo: str = typer.Option(DEFAULT_REPO or ..., help="owner/repo"),
-                open_url: bool = typer.Option(True, help="open Devin session URL")):
-    """
-    Scope ONE issue (clean UX):
-    - Start a fresh Devin session (non-idempotent)
-    - Poll until a *final* scoping block appears (or timeout)
-    - Print only Devin’s scoping + native Confidence
-    - Prompt to create a PR (optionally let Devin’s GH app open the PR)
-    """
-    issue = gh_get_issue(repo, number)
-    console.print(Panel.fit(f"[bold]Scoping issue #{number}[/]\n{issue['title']}"))
+def _keep_warm(session_id: str, stop: threading.Event, every_s: float = PROMPT_WARM_INTERVAL_S):
+    """Re-fetch the session until stopped so the pooled keep-alive connection stays open."""
+    while not stop.wait(every_s):
+        try:
+            devin_get_session(session_id)
+        except _HTTP_ERRORS:
+            pass  # best-effort; the real poll will surface errors
 
-    # Create session
-    prompt = (
+# ---------- CLI Commands ----------
+def _scope_prompt(repo: str, issue: Dict[str, Any]) -> str:
+    return (
         f"Scope this issue in repo https://github.com/{repo}.\n"
         f"Title: {issue['title']}\n\nBody:\n{issue.get('body','')}\n\n"
         "Please write your scoping in the conversation (Current / Requested / Files / Tests / Risks if any).\n"
@@ -268,16 +456,8 @@ def scope_issue(number: int = typer.Option(..., "-n", help="issue number"),
         "Confidence: High 🟢 - <why>   (or Medium 🟡 / Low 🔴)\n"
         "Then wait for next instruction."
     )
-    ses = devin_create_session(prompt, f"Scope {repo}#{number}")
-    sid = ses["session_id"]
-    if open_url and ses.get("url"):
-        console.print(f"[dim]Session:[/] {ses['url']}")
-
-    # Baseline & poll for scoping
-    initial = devin_get_session(sid)
-    baseline_len = len(initial.get("messages") or [])
-    scoping_texts, snap = poll_for_final_scoping(sid, baseline_len, POLL_MSG_TIMEOUT_S, EXTRA_SCOPE_WAIT_S)
 
+def _print_scoping(number: int, scoping_texts: List[str], snap: Dict[str, Any], baseline_len: int):
     # Print scoping
     console.rule(f"Scoping result for #{number}")
     if scoping_texts:
@@ -298,8 +478,61 @@ def scope_issue(number: int = typer.Option(..., "-n", help="issue number"),
     display_conf = color or "-"
     console.print(f"\n[bold]Confidence:[/] {display_conf}{f' — {why}' if why else ''}")
 
-    # Prompt to PR
-    choice = input(f"\nCreate a PR for issue #{number}? [y/N]: ").strip().lower()
+@issues_app.command("list")
+def list_issues(repo: str = typer.Option(DEFAULT_REPO or ..., help="owner/repo")):
+    issues = gh_iter_issues(repo)
+    rows = ((i["number"], i["title"], i["state"],
+             ",".join(l["name"] for l in i.get("labels") or ()),
+             i["html_url"]) for i in issues)
+    # The url is never truncated: on narrow terminals it folds onto extra lines (still a
+    # clickable link where the terminal supports it) and the title wraps.
+    table = Table()
+    table.add_column("#", no_wrap=True)
+    table.add_column("title")
+    table.add_column("state", no_wrap=True)
+    table.add_column("labels", overflow="fold")
+    table.add_column("url", overflow="fold")
+    for *cells, url in rows:
+        table.add_row(*(escape(str(c)) for c in cells),  # titles may contain [brackets]
+                      f"[link={url}]{escape(url)}[/link]")
+    console.print(Panel.fit(f"[bold]{repo}[/] • {table.row_count} issues"))
+    console.print(table)
+
+@issues_app.command("scope")
+def scope_issue(number: int = typer.Option(..., "-n", help="issue number"),
+                repo: str = typer.Option(DEFAULT_REPO or ..., help="owner/repo"),
+                open_url: bool = typer.Option(True, help="open Devin session URL")):
+    """
+    Scope ONE issue (clean UX):
+    - Start a fresh Devin session (non-idempotent)
+    - Poll until a *final* scoping block appears (or timeout)
+    - Print only Devin’s scoping + native Confidence
+    - Prompt to create a PR (optionally let Devin’s GH app open the PR)
+    """
+    issue = gh_get_issue(repo, number)
+    console.print(Panel.fit(f"[bold]Scoping issue #{number}[/]\n{issue['title']}"))
+
+    # Create session
+    ses = devin_create_session(_scope_prompt(repo, issue), f"Scope {repo}#{number}")
+    sid = ses["session_id"]
+    if open_url and ses.get("url"):
+        console.print(f"[dim]Session:[/] {ses['url']}")
+
+    # Baseline & poll for scoping
+    initial = devin_get_session(sid)
+    baseline_len = len(initial.get("messages") or [])
+    scoping_texts, snap = asyncio.run(
+        apoll_for_final_scoping(sid, baseline_len, POLL_MSG_TIMEOUT_S, EXTRA_SCOPE_WAIT_S))
+
+    _print_scoping(number, scoping_texts, snap, baseline_len)
+
+    # Prompt to PR (keep the Devin connection warm while the user reads)
+    stop_warm = threading.Event()
+    threading.Thread(target=_keep_warm, args=(sid, stop_warm), daemon=True).start()
+    try:
+        choice = input(f"\nCreate a PR for issue #{number}? [y/N]: ").strip().lower()
+    finally:
+        stop_warm.set()
     if choice != "y":
         console.print("[yellow]Skipped PR creation.[/]")
         return
@@ -320,7 +553,7 @@ def scope_issue(number: int = typer.Option(..., "-n", help="issue number"),
     )
     devin_send_message(sid, pr_instr)
 
-    pr_url = poll_for_pr_url(sid, timeout_s=POLL_PR_TIMEOUT_S)
+    pr_url = asyncio.run(apoll_for_pr_url(sid, len(snap.get("messages") or []), timeout_s=POLL_PR_TIMEOUT_S))
     if pr_url:
         console.print(Panel.fit(f"[green]✅ PR Created[/]\n{pr_url}", border_style="green"))
     else:
@@ -330,6 +563,41 @@ def scope_issue(number: int = typer.Option(..., "-n", help="issue number"),
             f"{ses.get('url','(session url unavailable)')}"
         ))
 
+@issues_app.command("scope-many")
+def scope_many(numbers: List[int] = typer.Option(..., "-n", help="issue number (repeatable)"),
+               repo: str = typer.Option(DEFAULT_REPO or ..., help="owner/repo")):
+    """
+    Scope several issues at once:
+    - Fetch all issues concurrently
+    - Start one Devin session per issue and poll them all in parallel
+    - Print each scoping + native Confidence (no PR prompt)
+    """
+    issues = gh_get_issues_bulk(repo, numbers)
+    sessions: List[Tuple[Dict[str, Any], int]] = []  # (session, baseline_len)
+    for number, issue in zip(numbers, issues):
+        console.print(Panel.fit(f"[bold]Scoping issue #{number}[/]\n{issue['title']}"))
+        ses = devin_create_session(_scope_prompt(repo, issue), f"Scope {repo}#{number}")
+        if ses.get("url"):
+            console.print(f"[dim]Session:[/] {ses['url']}")
+        # Baseline right away (as scope_issue does) so early replies aren't skipped
+        initial = devin_get_session(ses["session_id"])
+        sessions.append((ses, len(initial.get("messages") or [])))
+
+    async def _scope_all():
+        return await asyncio.gather(
+            *(apoll_for_final_scoping(ses["session_id"], baseline_len, POLL_MSG_TIMEOUT_S, EXTRA_SCOPE_WAIT_S)
+              for ses, baseline_len in sessions),
+            return_exceptions=True)  # one failed session shouldn't discard the others' results
+
+    for number, (ses, baseline_len), result in zip(numbers, sessions, asyncio.run(_scope_all())):
+        if isinstance(result, Exception):
+            console.rule(f"Scoping result for #{number}")
+            console.print(f"[red]Polling failed:[/] {escape(str(result))}\n"
+                          f"Check the Devin session: {ses.get('url','(session url unavailable)')}")
+            continue
+        texts, snap = result
+        _print_scoping(number, texts, snap, baseline_len)
+
 def main():
     app()  # this runs the Typer CLI
 